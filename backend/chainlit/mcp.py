@@ -1,9 +1,11 @@
+import functools
+import re
 import shlex
-from typing import Dict, Literal, Optional, Union
+from typing import Annotated, Dict, Literal, NamedTuple, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from chainlit.config import config
+from chainlit.config import McpStdioFeature, config
 
 
 class StdioMcpConnection(BaseModel):
@@ -27,7 +29,120 @@ class HttpMcpConnection(BaseModel):
     clientType: Literal["streamable-http"] = "streamable-http"
 
 
-McpConnection = Union[StdioMcpConnection, SseMcpConnection, HttpMcpConnection]
+McpConnection = Annotated[
+    Union[StdioMcpConnection, SseMcpConnection, HttpMcpConnection],
+    Field(discriminator="clientType"),
+]
+
+# One lexical piece of a POSIX command line: a run of whitespace, a run of plain
+# characters, a single-quoted string, a double-quoted string or an escaped char.
+_COMMAND_PIECE = re.compile(
+    r"""([ \t\r\n]+)|([^ \t\r\n'"\\]+)|'([^']*)'|"((?:[^"\\]|\\[\s\S])*)"|\\([\s\S])"""
+)
+# Inside double quotes, a backslash only escapes a double quote or a backslash
+_DOUBLE_QUOTED_ESCAPE = re.compile(r'\\(["\\])')
+# shlex only treats these characters as whitespace, unlike str.split()
+_WHITESPACE = " \t\r\n"
+_WHITESPACE_RUN = re.compile(r"[ \t\r\n]+")
+
+
+def _split_mcp_command(command_string: str) -> list[str]:
+    """
+    Split a command string the same way as `shlex.split(command_string, posix=True)`.
+
+    shlex reads its input one character at a time, whereas this walks the string
+    piece by piece and copies plain runs as slices. Input it cannot tokenize
+    (an unterminated quote or a trailing backslash) is handed over to shlex so
+    that the error raised is the usual one.
+    """
+    # Most commands have nothing to unquote or unescape, splitting them on
+    # whitespace runs is enough.
+    if (
+        '"' not in command_string
+        and "'" not in command_string
+        and "\\" not in command_string
+    ):
+        stripped = command_string.strip(_WHITESPACE)
+        return _WHITESPACE_RUN.split(stripped) if stripped else []
+
+    parts: list[str] = []
+    token: list[str] = []
+    in_token = False
+    pos = 0
+    end = len(command_string)
+    match = _COMMAND_PIECE.match
+    while pos < end:
+        piece = match(command_string, pos)
+        if piece is None:
+            return shlex.split(command_string, posix=True)
+        pos = piece.end()
+        # Every alternative of the pattern is a group, so one always matched
+        kind = piece.lastindex
+        assert kind is not None
+        if kind == 1:
+            if in_token:
+                parts.append("".join(token))
+                token.clear()
+                in_token = False
+            continue
+        value = piece.group(kind)
+        if kind == 4 and "\\" in value:
+            value = _DOUBLE_QUOTED_ESCAPE.sub(r"\1", value)
+        token.append(value)
+        in_token = True
+
+    if in_token:
+        parts.append("".join(token))
+    return parts
+
+
+class _AllowedExecutables(NamedTuple):
+    """Allowed executables as a set and the disallowed command error.
+
+    Also keeps what they were derived from, so that replacing the stdio settings
+    (reload_config replaces config.features) or its list, or mutating the list in
+    place, invalidates the entry.
+    """
+
+    stdio: McpStdioFeature
+    source: Optional[list[str]]
+    snapshot: Optional[list[str]]
+    allowed: Optional[frozenset[str]]
+    error: str
+
+
+_allowed_executables_cache: Optional[_AllowedExecutables] = None
+
+
+def _get_allowed_executables() -> tuple[Optional[frozenset[str]], str]:
+    """Return the allowed executables as a set, and the disallowed command error."""
+    global _allowed_executables_cache
+
+    stdio = config.features.mcp.stdio
+    allowed_executables = stdio.allowed_executables
+    cache = _allowed_executables_cache
+    if (
+        cache is None
+        or cache.stdio is not stdio
+        or cache.source is not allowed_executables
+        or cache.snapshot != allowed_executables
+    ):
+        cache = _AllowedExecutables(
+            stdio=stdio,
+            source=allowed_executables,
+            snapshot=list(allowed_executables)
+            if allowed_executables is not None
+            else None,
+            allowed=frozenset(allowed_executables)
+            if allowed_executables is not None
+            else None,
+            error=f"Only commands in ({', '.join(allowed_executables)}) are allowed"
+            if allowed_executables
+            else "No allowed executables found",
+        )
+        _allowed_executables_cache = cache
+
+    return cache.allowed, cache.error
 
 
 def validate_mcp_command(command_string: str):
@@ -50,15 +165,42 @@ def validate_mcp_command(command_string: str):
     Raises:
         ValueError: If the command doesn't use an allowed executable
     """
+    allowed_executables_set, not_allowed_error = _get_allowed_executables()
+    parsed = _validate_mcp_command_cached(command_string, allowed_executables_set)
+
+    if parsed is None:
+        raise ValueError(not_allowed_error)
+
+    env, executable, args_list = parsed
+    # Hand out fresh containers so callers cannot alter the cached result
+    return dict(env), executable, list(args_list)
+
+
+# MCP commands often carry secrets (`API_KEY=... npx`, `--header "Authorization:
+# Bearer ..."`), and both the cache keys and the parsed results hold them, so
+# hashing the key alone would not help. The cache is shared by all sessions,
+# keep it small to bound how many of these outlive the connections they came
+# from.
+@functools.lru_cache(maxsize=16)
+def _validate_mcp_command_cached(
+    command_string: str, allowed_executables: Optional[frozenset[str]]
+) -> Optional[tuple[tuple[tuple[str, str], ...], str, tuple[str, ...]]]:
+    """
+    Parse a command string against the allowed executables.
+
+    Returns None when no allowed executable is found. The result only depends
+    on the arguments, so it is memoized for repeated connections. Note that
+    memoized commands, secrets included, stay in process memory until evicted.
+    """
     # Split the command string into parts while respecting quotes and escapes
-    # Using shlex.split provides POSIX-compatible parsing so that arguments
+    # The split follows POSIX shlex rules so that arguments
     # wrapped in quotes (e.g. "--header \"Authorization: Bearer TOKEN\"")
     # or environment variable assignments such as
     # MY_VAR="value with spaces" are preserved as single list items.
-    # On Windows, shlex also works as long as posix=False is not required for
+    # On Windows, this also works as long as posix=False is not required for
     # our use-case (Chainlit targets POSIX-style shells for the MCP command).
     try:
-        parts = shlex.split(command_string, posix=True)
+        parts = _split_mcp_command(command_string)
     except ValueError as exc:
         # Provide a clearer error message when the command cannot be parsed
         raise ValueError(f"Invalid command string: {exc}") from exc
@@ -69,31 +211,26 @@ def validate_mcp_command(command_string: str):
     # Look for the actual executable in the command
     executable = None
     executable_index = None
-    allowed_executables = config.features.mcp.stdio.allowed_executables
     for i, part in enumerate(parts):
         # Remove any path components to get the base executable name
-        base_exec = part.split("/")[-1].split("\\")[-1]
+        base_exec = part
+        if "/" in base_exec or "\\" in base_exec:
+            base_exec = base_exec.rpartition("/")[2].rpartition("\\")[2]
         if allowed_executables is None or base_exec in allowed_executables:
             executable = part
             executable_index = i
             break
 
     if executable is None or executable_index is None:
-        raise ValueError(
-            f"Only commands in ({', '.join(allowed_executables)}) are allowed"
-            if allowed_executables
-            else "No allowed executables found"
-        )
+        return None
 
     # Return `executable` as the executable and everything after it as args
-    args_list = parts[executable_index + 1 :]
-    env_list = parts[:executable_index]
-    env = {}
-    for env_var in env_list:
-        if "=" in env_var:
-            key, value = env_var.split("=", 1)
-            env[key] = value
-        else:
+    args_list = tuple(parts[executable_index + 1 :])
+    env: dict[str, str] = {}
+    for env_var in parts[:executable_index]:
+        key, sep, value = env_var.partition("=")
+        if not sep:
             raise ValueError(f"Invalid environment variable format: {env_var}")
+        env[key] = value
 
-    return env, executable, args_list
+    return tuple(env.items()), executable, args_list
@@ -1143,6 +1143,8 @@ async def connect_mcp(
 
         try:
             exit_stack = AsyncExitStack()
+            # The payload has already been validated by FastAPI, build the
+            # connection from its fields without validating them a second time.
             mcp_connection: McpConnection
 
             if payload.clientType == "sse":
@@ -1152,7 +1154,7 @@ async def connect_mcp(
                         detail="SSE MCP is not enabled",
                     )
 
-                mcp_connection = SseMcpConnection(
+                mcp_connection = SseMcpConnection.model_construct(
                     url=payload.url,
                     name=payload.name,
                     headers=getattr(payload, "headers", None),
@@ -1172,7 +1174,7 @@ async def connect_mcp(
                     )
 
                 env_from_cmd, command, args = validate_mcp_command(payload.fullCommand)
-                mcp_connection = StdioMcpConnection(
+                mcp_connection = StdioMcpConnection.model_construct(
                     command=command, args=args, name=payload.name
                 )
 
@@ -1193,7 +1195,7 @@ async def connect_mcp(
                         status_code=400,
                         detail="HTTP MCP is not enabled",
                     )
-                mcp_connection = HttpMcpConnection(
+                mcp_connection = HttpMcpConnection.model_construct(
                     url=payload.url,
                     name=payload.name,
                     headers=getattr(payload, "headers", None),
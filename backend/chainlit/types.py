@@ -1,32 +1,172 @@
+import dataclasses
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from operator import methodcaller
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
+    Callable,
     Dict,
     Generic,
     List,
     Literal,
     Optional,
-    Protocol,
     TypedDict,
     TypeVar,
     Union,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
 
 if TYPE_CHECKING:
     from chainlit.element import ElementDict
     from chainlit.step import StepDict
 
-from dataclasses_json import DataClassJsonMixin
-from pydantic import BaseModel
-from pydantic.dataclasses import dataclass
+from pydantic import BaseModel, Field
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
+else:
+
+    class _StrEnum(str, Enum):
+        # Match StrEnum, whose members format as their plain value
+        __str__ = str.__str__
+        __format__ = str.__format__  # type: ignore[assignment]
+
 
 InputWidgetType = Literal[
     "switch", "slider", "select", "textinput", "tags", "numberinput"
 ]
 ToastType = Literal["info", "success", "warning", "error"]
 
+# Shared read-only default for missing mappings, never mutate it
+_EMPTY_DICT: Dict = {}
+
+
+def _nested_converter(
+    tp: Any, convert: Callable[[type], Callable[[Any], Any]]
+) -> Optional[Callable[[Any], Any]]:
+    """Build a converter for the dataclasses nested in `tp`, None if there are none."""
+    if dataclasses.is_dataclass(tp):
+        return convert(tp)  # type: ignore[arg-type]
+
+    origin = get_origin(tp)
+    args = get_args(tp)
+    if origin is Union:
+        converters = [_nested_converter(arg, convert) for arg in args]
+        if not any(converters):
+            return None
+        if len(args) != 2 or type(None) not in args:
+            raise TypeError(f"Unsupported union of dataclasses: {tp}")
+        inner = next(c for c in converters if c)
+        return lambda v: None if v is None else inner(v)
+    if origin is list:
+        item = _nested_converter(args[0], convert)
+        return (lambda v: [item(x) for x in v]) if item else None
+    if origin is dict:
+        value = _nested_converter(args[1], convert)
+        return (lambda v: {k: value(x) for k, x in v.items()}) if value else None
+    return None
+
+
+_J = TypeVar("_J", bound="_JsonDataclass")
+
+
+class _JsonDataclass:
+    """Base of the dataclasses decorated with `_fast_json`."""
+
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+
+        def to_dict(self) -> Dict[str, Any]: ...
+
+        @classmethod
+        def from_dict(cls: type[_J], kvs: Dict[str, Any]) -> _J: ...
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # The methods generated for a parent class would drop the fields added by
+        # a subclass (e.g. a user subclass of Starter). Generate them for the
+        # subclass on first use, unless `_fast_json` is applied to it right away.
+        # Methods the subclass defines itself are left alone.
+        if "to_dict" not in cls.__dict__:
+            setattr(cls, "to_dict", _to_dict_on_first_use)
+        if "from_dict" not in cls.__dict__:
+            setattr(cls, "from_dict", classmethod(_from_dict_on_first_use))
+
+
+def _to_dict_on_first_use(self):
+    return _fast_json(type(self)).to_dict(self)
+
+
+def _from_dict_on_first_use(cls, kvs):
+    return _fast_json(cls).from_dict(kvs)
+
+
+def _fast_json(cls):
+    """
+    Generate straight-line `to_dict` and `from_dict` methods for a dataclass.
+
+    The fields are inspected once, when the class is decorated, instead of on
+    every call as `dataclasses_json` does.
+    """
+    hints = get_type_hints(cls)
+    namespace: Dict[str, Any] = {}
+    to_dict_items = []
+    from_dict_lines = []
+    for field in dataclasses.fields(cls):
+        name = field.name
+        encode = _nested_converter(hints[name], lambda tp: methodcaller("to_dict"))
+        decode = _nested_converter(hints[name], lambda tp: tp.from_dict)
+        value = f"self.{name}"
+        if encode:
+            namespace[f"_encode_{name}"] = encode
+            value = f"_encode_{name}({value})"
+        to_dict_items.append(f"{name!r}: {value}")
+
+        value = f"kvs[{name!r}]"
+        if decode:
+            namespace[f"_decode_{name}"] = decode
+            value = f"_decode_{name}({value})"
+        if (
+            field.default is dataclasses.MISSING
+            and field.default_factory is dataclasses.MISSING
+        ):
+            from_dict_lines.append(f"    kwargs[{name!r}] = {value}")
+        else:
+            from_dict_lines.append(
+                f"    if {name!r} in kvs:\n        kwargs[{name!r}] = {value}"
+            )
+
+    source = "\n".join(
+        [
+            "def to_dict(self):",
+            f"    return {{{', '.join(to_dict_items)}}}",
+            "def from_dict(cls, kvs):",
+            "    kwargs = {}",
+            *from_dict_lines,
+            "    return cls(**kwargs)",
+        ]
+    )
+    exec(source, namespace)
+
+    # Only replace the first-use stubs, never methods the class defines itself
+    if cls.__dict__.get("to_dict", _to_dict_on_first_use) is _to_dict_on_first_use:
+        cls.to_dict = namespace["to_dict"]
+    from_dict = cls.__dict__.get("from_dict")
+    if (
+        from_dict is None
+        or getattr(from_dict, "__func__", None) is _from_dict_on_first_use
+    ):
+        cls.from_dict = classmethod(namespace["from_dict"])
+    return cls
+
 
 class ThreadDict(TypedDict):
     id: str
@@ -51,7 +191,7 @@ class ThreadFilter(BaseModel):
     search: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PageInfo:
     hasNextPage: bool
     startCursor: Optional[str]
@@ -77,51 +217,55 @@ class PageInfo:
 T = TypeVar("T", covariant=True)
 
 
-class HasFromDict(Protocol[T]):
-    @classmethod
-    def from_dict(cls, obj_dict: Any) -> T:
-        raise NotImplementedError
-
-
-@dataclass
+@dataclass(slots=True)
 class PaginatedResponse(Generic[T]):
     pageInfo: PageInfo
     data: List[T]
 
     def to_dict(self):
+        # Items of a page share the same type, probe it once rather than per item
+        if self.data and callable(getattr(type(self.data[0]), "to_dict", None)):
+            data = [d.to_dict() for d in self.data]
+        else:
+            data = list(self.data)
+
         return {
             "pageInfo": self.pageInfo.to_dict(),
-            "data": [
-                (d.to_dict() if hasattr(d, "to_dict") and callable(d.to_dict) else d)
-                for d in self.data
-            ],
+            "data": data,
         }
 
     @classmethod
     def from_dict(
-        cls, paginated_response_dict: Dict, the_class: HasFromDict[T]
+        cls, paginated_response_dict: Dict, from_item: Callable[[Dict], T]
     ) -> "PaginatedResponse[T]":
-        pageInfo = PageInfo.from_dict(paginated_response_dict.get("pageInfo", {}))
+        pageInfo = PageInfo.from_dict(
+            paginated_response_dict.get("pageInfo") or _EMPTY_DICT
+        )
 
-        data = [the_class.from_dict(d) for d in paginated_response_dict.get("data", [])]
+        data = [from_item(d) for d in paginated_response_dict.get("data") or ()]
 
         return cls(pageInfo=pageInfo, data=data)
 
 
-@dataclass
-class FileSpec(DataClassJsonMixin):
+# Specs, starters and chat profiles are built from user arguments, so unlike
+# the other dataclasses here they keep pydantic validation and coercion.
+@_fast_json
+@pydantic_dataclass(slots=True)
+class FileSpec(_JsonDataclass):
     accept: Union[List[str], Dict[str, List[str]]]
     max_files: int
     max_size_mb: int
 
 
-@dataclass
-class ActionSpec(DataClassJsonMixin):
+@_fast_json
+@pydantic_dataclass(slots=True)
+class ActionSpec(_JsonDataclass):
     keys: List[str]
 
 
-@dataclass
-class AskSpec(DataClassJsonMixin):
+@_fast_json
+@pydantic_dataclass(slots=True)
+class AskSpec(_JsonDataclass):
     """Specification for asking the user."""
 
     timeout: int
@@ -129,18 +273,29 @@ class AskSpec(DataClassJsonMixin):
     step_id: str
 
 
-@dataclass
-class AskFileSpec(FileSpec, AskSpec, DataClassJsonMixin):
+# The Ask*Spec classes declare the fields of FileSpec / ActionSpec themselves
+# rather than inheriting them, so that each one has a single, slotted base.
+@_fast_json
+@pydantic_dataclass(slots=True)
+class AskFileSpec(AskSpec):
     """Specification for asking the user a file."""
 
+    accept: Union[List[str], Dict[str, List[str]]]
+    max_files: int
+    max_size_mb: int
 
-@dataclass
-class AskActionSpec(ActionSpec, AskSpec, DataClassJsonMixin):
+
+@_fast_json
+@pydantic_dataclass(slots=True)
+class AskActionSpec(AskSpec):
     """Specification for asking the user an action"""
 
+    keys: List[str]
+
 
-@dataclass
-class AskElementSpec(AskSpec, DataClassJsonMixin):
+@_fast_json
+@pydantic_dataclass(slots=True)
+class AskElementSpec(AskSpec):
     """Specification for asking the user a custom element"""
 
     element_id: str
@@ -170,7 +325,7 @@ class InputAudioChunkPayload(TypedDict):
     data: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class InputAudioChunk:
     isStart: bool
     mimeType: str
@@ -184,7 +339,7 @@ class OutputAudioChunk(TypedDict):
     data: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class AskFileResponse:
     id: str
     name: str
@@ -254,8 +409,11 @@ class ConnectStreamableHttpMCPRequest(BaseModel):
     headers: Optional[Dict[str, str]] = None
 
 
-ConnectMCPRequest = Union[
-    ConnectStdioMCPRequest, ConnectSseMCPRequest, ConnectStreamableHttpMCPRequest
+ConnectMCPRequest = Annotated[
+    Union[
+        ConnectStdioMCPRequest, ConnectSseMCPRequest, ConnectStreamableHttpMCPRequest
+    ],
+    Field(discriminator="clientType"),
 ]
 
 
@@ -269,13 +427,14 @@ class ElementRequest(BaseModel):
     sessionId: str
 
 
-class Theme(str, Enum):
+class Theme(_StrEnum):
     light = "light"
     dark = "dark"
 
 
-@dataclass
-class Starter(DataClassJsonMixin):
+@_fast_json
+@pydantic_dataclass(slots=True)
+class Starter(_JsonDataclass):
     """Specification for a starter that can be chosen by the user at the thread start."""
 
     label: str
@@ -284,8 +443,9 @@ class Starter(DataClassJsonMixin):
     icon: Optional[str] = None
 
 
-@dataclass
-class ChatProfile(DataClassJsonMixin):
+@_fast_json
+@pydantic_dataclass(slots=True)
+class ChatProfile(_JsonDataclass):
     """Specification for a chat profile that can be chosen by the user at the thread start."""
 
     name: str
@@ -318,8 +478,9 @@ class FeedbackDict(TypedDict):
     comment: Optional[str]
 
 
-@dataclass
-class Feedback:
+@_fast_json
+@dataclass(slots=True)
+class Feedback(_JsonDataclass):
     forId: str
     value: Literal[0, 1]
     threadId: Optional[str] = None
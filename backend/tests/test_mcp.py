@@ -0,0 +1,164 @@
+import shlex
+
+import pytest
+from pydantic import TypeAdapter
+
+from chainlit.config import FeaturesSettings, McpFeature, McpStdioFeature, config
+from chainlit.mcp import (
+    HttpMcpConnection,
+    McpConnection,
+    SseMcpConnection,
+    _split_mcp_command,
+    validate_mcp_command,
+)
+
+
+def set_allowed_executables(monkeypatch, allowed_executables):
+    # Swap the whole features settings, as reload_config does
+    monkeypatch.setattr(
+        config,
+        "features",
+        FeaturesSettings(
+            mcp=McpFeature(
+                stdio=McpStdioFeature(allowed_executables=allowed_executables)
+            )
+        ),
+    )
+
+
+@pytest.fixture
+def allowed_executables(monkeypatch):
+    set_allowed_executables(monkeypatch, ["npx", "uvx"])
+
+
+@pytest.mark.parametrize(
+    "command",
+    [
+        "",
+        "   ",
+        "npx -y @modelcontextprotocol/server-filesystem /tmp",
+        "npx\t-y  pkg\n",
+        'MY_VAR="value with spaces" npx pkg',
+        "uvx mcp-server --header 'Authorization: Bearer TOKEN'",
+        'npx --header "Authorization: \\"quoted\\" \\\\ \\n"',
+        "npx a\\ b c\\'d",
+        "npx '' \"\" x''y",
+        "npx \"a\"b'c'd",
+        "npx\xa0-y pkg",
+        "npx\x0c--yes pkg",
+        "npx -y\x0bpkg",
+        "npx '' \x0bx",
+        "\x0b npx\u2003pkg \x0b",
+    ],
+)
+def test_split_mcp_command_matches_shlex(command):
+    assert _split_mcp_command(command) == shlex.split(command, posix=True)
+
+
+@pytest.mark.parametrize(
+    ("command", "error"),
+    [
+        ("npx 'unterminated", "No closing quotation"),
+        ('npx "open', "No closing quotation"),
+        ("npx \\", "No escaped character"),
+    ],
+)
+def test_split_mcp_command_invalid(command, error):
+    with pytest.raises(ValueError, match=error):
+        _split_mcp_command(command)
+
+
+def test_validate_mcp_command(allowed_executables):
+    env, executable, args = validate_mcp_command(
+        'FOO=bar BAZ="a b" /usr/bin/npx -y "@scope/pkg" --flag'
+    )
+
+    assert env == {"FOO": "bar", "BAZ": "a b"}
+    assert executable == "/usr/bin/npx"
+    assert args == ["-y", "@scope/pkg", "--flag"]
+
+
+def test_validate_mcp_command_unquoted(allowed_executables):
+    env, executable, args = validate_mcp_command("FOO=bar  npx -y pkg\t/tmp")
+
+    assert env == {"FOO": "bar"}
+    assert executable == "npx"
+    assert args == ["-y", "pkg", "/tmp"]
+
+
+def test_validate_mcp_command_disallowed_executable(allowed_executables):
+    with pytest.raises(ValueError, match=r"Only commands in \(npx, uvx\) are allowed"):
+        validate_mcp_command("rm -rf /")
+
+
+@pytest.mark.parametrize("command", ["npx\xa0-y pkg", "npx\x0c--yes pkg"])
+def test_validate_mcp_command_only_splits_on_shlex_whitespace(
+    allowed_executables, command
+):
+    with pytest.raises(ValueError, match=r"Only commands in \(npx, uvx\) are allowed"):
+        validate_mcp_command(command)
+
+
+def test_validate_mcp_command_invalid_env(allowed_executables):
+    with pytest.raises(ValueError, match="Invalid environment variable format"):
+        validate_mcp_command("FOO npx pkg")
+
+
+def test_validate_mcp_command_unparsable(allowed_executables):
+    with pytest.raises(ValueError, match="Invalid command string"):
+        validate_mcp_command("npx 'pkg")
+
+
+def test_validate_mcp_command_empty(allowed_executables):
+    with pytest.raises(ValueError, match="Empty command string"):
+        validate_mcp_command("  ")
+
+
+def test_validate_mcp_command_result_is_not_shared(allowed_executables):
+    env, _, args = validate_mcp_command("FOO=bar npx pkg")
+    env["FOO"] = "changed"
+    args.append("--extra")
+
+    assert validate_mcp_command("FOO=bar npx pkg") == ({"FOO": "bar"}, "npx", ["pkg"])
+
+
+def test_validate_mcp_command_follows_config_reload(monkeypatch):
+    set_allowed_executables(monkeypatch, ["npx"])
+    validate_mcp_command("npx pkg")
+
+    set_allowed_executables(monkeypatch, ["uvx"])
+    with pytest.raises(ValueError, match=r"Only commands in \(uvx\) are allowed"):
+        validate_mcp_command("npx pkg")
+
+
+def test_validate_mcp_command_windows_path(allowed_executables):
+    _, executable, args = validate_mcp_command("C:\\\\tools\\\\uvx server")
+
+    assert executable == "C:\\tools\\uvx"
+    assert args == ["server"]
+
+
+@pytest.mark.parametrize(
+    ("client_type", "connection_class"),
+    [("sse", SseMcpConnection), ("streamable-http", HttpMcpConnection)],
+)
+def test_mcp_connection_discriminated_by_client_type(client_type, connection_class):
+    connection = TypeAdapter(McpConnection).validate_python(
+        {"clientType": client_type, "name": "test", "url": "http://localhost"}
+    )
+
+    assert type(connection) is connection_class
+
+
+def test_validate_mcp_command_follows_in_place_changes(allowed_executables):
+    with pytest.raises(ValueError, match="Only commands in"):
+        validate_mcp_command("node server.js")
+
+    stdio = config.features.mcp.stdio
+    assert stdio.allowed_executables is not None
+    stdio.allowed_executables.append("node")
+    assert validate_mcp_command("node server.js")[1] == "node"
+
+    stdio.allowed_executables = ["uvx"]
+    with pytest.raises(ValueError, match=r"Only commands in \(uvx\) are allowed"):
+        validate_mcp_command("npx pkg")
@@ -0,0 +1,207 @@
+from dataclasses import dataclass
+
+from chainlit.types import (
+    AskFileSpec,
+    ChatProfile,
+    Feedback,
+    PageInfo,
+    PaginatedResponse,
+    Starter,
+    Theme,
+)
+
+
+def test_paginated_response_to_dict_with_dict_items():
+    response = PaginatedResponse(
+        pageInfo=PageInfo(hasNextPage=True, startCursor="a", endCursor="b"),
+        data=[{"id": "1"}, {"id": "2"}],
+    )
+
+    assert response.to_dict() == {
+        "pageInfo": {"hasNextPage": True, "startCursor": "a", "endCursor": "b"},
+        "data": [{"id": "1"}, {"id": "2"}],
+    }
+
+
+def test_paginated_response_to_dict_with_serializable_items():
+    response = PaginatedResponse(
+        pageInfo=PageInfo(hasNextPage=False, startCursor=None, endCursor=None),
+        data=[Starter(label="Hi", message="Hello")],
+    )
+
+    assert response.to_dict()["data"] == [
+        {"label": "Hi", "message": "Hello", "command": None, "icon": None}
+    ]
+
+
+def test_paginated_response_to_dict_empty():
+    response = PaginatedResponse(
+        pageInfo=PageInfo(hasNextPage=False, startCursor=None, endCursor=None),
+        data=[],
+    )
+
+    assert response.to_dict()["data"] == []
+
+
+def test_paginated_response_from_dict_missing_keys():
+    response = PaginatedResponse.from_dict({}, PageInfo.from_dict)
+
+    assert response.pageInfo == PageInfo(
+        hasNextPage=False, startCursor=None, endCursor=None
+    )
+    assert response.data == []
+
+
+def test_chat_profile_to_dict_round_trip():
+    profile = ChatProfile(
+        name="GPT",
+        markdown_description="A profile",
+        starters=[Starter(label="Hi", message="Hello", icon="/hi.svg")],
+    )
+
+    profile_dict = profile.to_dict()
+
+    assert profile_dict == {
+        "name": "GPT",
+        "markdown_description": "A profile",
+        "icon": None,
+        "default": False,
+        "starters": [
+            {"label": "Hi", "message": "Hello", "command": None, "icon": "/hi.svg"}
+        ],
+    }
+    assert ChatProfile.from_dict(profile_dict) == profile
+
+
+def test_chat_profile_coerces_starter_dicts():
+    profile = ChatProfile(
+        name="GPT",
+        markdown_description="A profile",
+        starters=[{"label": "Hi", "message": "Hello"}],  # type: ignore[list-item]
+    )
+
+    assert profile.starters == [Starter(label="Hi", message="Hello")]
+    assert profile.to_dict()["starters"] == [
+        {"label": "Hi", "message": "Hello", "command": None, "icon": None}
+    ]
+
+
+def test_ask_file_spec_to_dict_includes_inherited_fields():
+    spec = AskFileSpec(
+        accept=["text/plain"],
+        max_files=1,
+        max_size_mb=2,
+        timeout=60,
+        type="file",
+        step_id="step",
+    )
+
+    assert spec.to_dict() == {
+        "timeout": 60,
+        "type": "file",
+        "step_id": "step",
+        "accept": ["text/plain"],
+        "max_files": 1,
+        "max_size_mb": 2,
+    }
+
+
+def test_feedback_from_dict_uses_defaults():
+    feedback = Feedback.from_dict({"forId": "step", "value": 1})
+
+    assert feedback == Feedback(forId="step", value=1)
+
+
+def test_paginated_response_from_dict_maps_items():
+    response = PaginatedResponse.from_dict(
+        {
+            "pageInfo": {"hasNextPage": True, "endCursor": "b"},
+            "data": [{"label": "Hi", "message": "Hello"}],
+        },
+        Starter.from_dict,
+    )
+
+    assert response.pageInfo == PageInfo(
+        hasNextPage=True, startCursor=None, endCursor="b"
+    )
+    assert response.data == [Starter(label="Hi", message="Hello")]
+
+
+@dataclass
+class _TaggedStarter(Starter):
+    tag: str = "default"
+
+
+def test_starter_subclass_to_dict_includes_own_fields():
+    starter = _TaggedStarter(label="Hi", message="Hello", tag="greeting")
+
+    assert starter.to_dict() == {
+        "label": "Hi",
+        "message": "Hello",
+        "command": None,
+        "icon": None,
+        "tag": "greeting",
+    }
+    assert _TaggedStarter.from_dict(starter.to_dict()) == starter
+    assert Starter(label="Hi", message="Hello").to_dict() == {
+        "label": "Hi",
+        "message": "Hello",
+        "command": None,
+        "icon": None,
+    }
+
+
+class _CustomStarter(Starter):
+    def to_dict(self):
+        return {"custom": self.label}
+
+    @classmethod
+    def from_dict(cls, kvs):
+        return cls(label=kvs["custom"], message="from custom")
+
+
+def test_starter_subclass_keeps_own_to_dict_and_from_dict():
+    starter = _CustomStarter(label="Hi", message="Hello")
+
+    assert starter.to_dict() == {"custom": "Hi"}
+    assert _CustomStarter.from_dict({"custom": "Hi"}) == _CustomStarter(
+        label="Hi", message="from custom"
+    )
+    assert ChatProfile(
+        name="GPT", markdown_description="A profile", starters=[starter]
+    ).to_dict()["starters"] == [{"custom": "Hi"}]
+
+
+class _CustomToDictStarter(Starter):
+    def to_dict(self):
+        return {"custom": self.label}
+
+
+def test_starter_subclass_keeps_own_to_dict_with_generated_from_dict():
+    starter = _CustomToDictStarter.from_dict({"label": "Hi", "message": "Hello"})
+
+    assert starter == _CustomToDictStarter(label="Hi", message="Hello")
+    assert starter.to_dict() == {"custom": "Hi"}
+
+
+def test_chat_profile_to_dict_with_starter_subclass():
+    profile = ChatProfile(
+        name="GPT",
+        markdown_description="A profile",
+        starters=[_TaggedStarter(label="Hi", message="Hello")],
+    )
+
+    assert profile.to_dict()["starters"] == [
+        {
+            "label": "Hi",
+            "message": "Hello",
+            "command": None,
+            "icon": None,
+            "tag": "default",
+        }
+    ]
+
+
+def test_theme_formats_as_its_value():
+    assert str(Theme.light) == "light"
+    assert f"logo_{Theme.dark}" == "logo_dark"
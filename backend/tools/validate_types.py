@@ -0,0 +1,52 @@
+"""
+Check the dataclasses of `chainlit.types` against their own annotations.
+
+Apart from the ones built from user arguments, these dataclasses are plain
+`dataclasses`, so nothing validates them when they are instantiated. This script
+runs on commit and in CI instead and makes sure that every field annotation
+resolves and that every default value matches its annotation.
+"""
+
+import dataclasses
+import sys
+from typing import get_type_hints
+
+from pydantic import TypeAdapter, ValidationError
+
+from chainlit import types
+
+
+def validate_types() -> list[str]:
+    errors = []
+    for name, obj in vars(types).items():
+        if not (
+            isinstance(obj, type)
+            and dataclasses.is_dataclass(obj)
+            and obj.__module__ == types.__name__
+        ):
+            continue
+
+        try:
+            hints = get_type_hints(obj)
+        except Exception as e:
+            errors.append(f"{name}: cannot resolve annotations ({e!s})")
+            continue
+
+        for field in dataclasses.fields(obj):
+            if field.default is dataclasses.MISSING:
+                continue
+            try:
+                TypeAdapter(hints[field.name]).validate_python(
+                    field.default, strict=True
+                )
+            except ValidationError as e:
+                errors.append(f"{name}.{field.name}: invalid default ({e!s})")
+
+    return errors
+
+
+if __name__ == "__main__":
+    errors = validate_types()
+    for error in errors:
+        print(error, file=sys.stderr)
+    sys.exit(1 if errors else 0)
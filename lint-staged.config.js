@@ -7,5 +7,8 @@ module.exports = {
     'poetry run -C backend ruff format',
     () => 'pnpm run lintPython'
   ],
+  'backend/chainlit/types.py': [
+    () => 'poetry run -C backend python -m tools.validate_types'
+  ],
   '.github/workflows/**': ['actionlint']
 };